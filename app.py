@@ -1,7 +1,10 @@
 import collections as c
 import functools as f
+import io
+import os
 import pathlib as p
-import shutil
+import tempfile
+import threading
 import typing as t
 
 import streamlit as st
@@ -26,18 +29,26 @@ Meta = util.type.DictStr[t.Any]
 Metas = t.Dict[Md5, Meta]
 Keywords = t.List[str]
 Rank = util.type.DictStr[t.List[bool]]
+Stamps = util.type.DictStr[str]
 
 
 class App:
     __version__ = '2023.03.07'
 
     _cache = p.Path('cache')
-    _cache.mkdir(parents=True, exist_ok=True)
+    _lru = p.Path('cache.lru')
+    _capacity = 1 << 30  # Byte
     _number = 7
     _default_text = '我能吞下玻璃而不伤身体'
     _default_keywords = '华文 行楷 Regular'
-
-    def __init__(self, metas: Metas) -> None:
+    _indexes = ['char2md5', 'file2md5', 'md52files', 'md52info']
+
+    def __init__(
+        self,
+        metas: Metas,
+        storage: util.storage.Storage,
+        snapshot: t.Optional[util.snapshot.Snapshot] = None,
+    ) -> None:
         self._all = c.OrderedDict([
             (func.__doc__, func) for func in [
                 self.list_font, self.preview_font, self.search_font_by_keyword,
@@ -45,16 +56,68 @@ class App:
             ]
         ])
         self._metas = metas
+        self._stamps: Stamps = {}
+        self._storage = storage
+        self._snapshot = snapshot
+        self._lock = threading.RLock()
+
+    @classmethod
+    def storage(cls, url: t.Optional[str] = None, capacity: t.Optional[int] = None) -> util.storage.Storage:
+        if url is None:
+            return util.storage.LocalStorage(cls._cache)
+        cache = util.storage.LRUCache(cls._lru, capacity or cls._capacity)
+        return util.storage.RemoteStorage(url, cache)
 
     @classmethod
-    def load(cls) -> 'Self':
-        metas = {}
-        for directory in cls._cache.iterdir():
-            if directory.is_dir():
-                meta = util.json.loads((directory/'meta.json').read_text())
-                assert meta['version'] == cls.__version__
-                metas[directory.name] = meta
-        return cls(metas)
+    def load(
+        cls,
+        storage: t.Optional[util.storage.Storage] = None,
+        path: t.Optional[util.type.Path] = None,
+    ) -> 'Self':
+        storage = storage or cls.storage()
+        if path is not None:
+            return cls.from_snapshot(path, storage)
+        self = cls({}, storage)
+        self._index()
+        self.refresh()
+        return self
+
+    @classmethod
+    def from_snapshot(cls, path: util.type.Path, storage: t.Optional[util.storage.Storage] = None) -> 'Self':
+        snapshot = util.snapshot.Snapshot.load(path)
+        assert snapshot['version'] == cls.__version__
+        self = cls(snapshot['metas'], storage or cls.storage(), snapshot)
+        self._stamps = snapshot['stamps']
+        for attr in self._indexes:
+            self.__dict__[attr] = snapshot[attr]
+        # reload the metas added or rewritten in the store since the export
+        self.refresh()
+        return self
+
+    def export(self, path: util.type.Path, blob: bool = False) -> None:
+        catalog = {
+            'version': self.__version__,
+            'metas': self._metas,
+            'stamps': self._stamps,
+            **{attr: getattr(self, attr) for attr in self._indexes},
+        }
+        sizes = {md5: meta['size'] for md5, meta in self._metas.items()} if blob else {}
+        util.snapshot.Snapshot.dump(path, catalog, sizes, f.partial(self._font, cache=False))
+
+    def refresh(self) -> None:
+        with self._lock:
+            stamps = self._storage.stamps()
+            md5s = {md5 for md5, stamp in stamps.items() if self._stamps.get(md5) != stamp}
+            if md5s:
+                # copy on write, sessions may be iterating the old metas
+                metas = dict(self._metas)
+                for md5 in md5s:
+                    meta = self._storage.read_meta(md5)
+                    assert meta['version'] == self.__version__
+                    metas[md5] = meta
+                self._metas = metas
+                self._stamps = {**self._stamps, **{md5: stamps[md5] for md5 in md5s}}
+                self._index()
 
     @property
     def all(self) -> AllApps:
@@ -112,10 +175,9 @@ class App:
         if options:
             option = options[0]
             md5 = self.file2md5[option]
-            path = self._cache / md5 / 'data.bin'
             filename = option[:-self._number-3]
             info = self._list_font_info(md5)
-            st.download_button('Download font', data=path.read_bytes(), file_name=filename, on_click=st.balloons)
+            st.download_button('Download font', data=self._font(md5), file_name=filename, on_click=st.balloons)
             if st.checkbox('Raw data', key=option):
                 st.json(info, expanded=True)
             else:
@@ -129,8 +191,7 @@ class App:
         if options:
             for option in options:
                 md5 = self.file2md5[option]
-                path = self._cache / md5 / 'data.bin'
-                font = ImageFont.truetype(path.as_posix(), size=size)
+                font = ImageFont.truetype(io.BytesIO(self._font(md5)), size=size)
                 _, _, width, height = font.getbbox(text)
                 with Image.new(mode='RGBA', size=(width, height)) as image:
                     ImageDraw \
@@ -169,13 +230,21 @@ class App:
             else:
                 st.markdown(f'- {file.name}: :green[{md5}]')
 
-    def _dump(self) -> None:
-        for md5, meta in self._metas.items():
-            (self._cache/md5/'meta.json').write_text(util.json.dumps(meta))
-
     def _files(self, md5s: Md5s) -> Files:
         return f.reduce(set.union, map(self.md52files.__getitem__, md5s), set())
 
+    def _font(self, md5: Md5, cache: bool = True) -> bytes:
+        content = None if self._snapshot is None else self._snapshot.blob(md5)
+        if content is None:
+            content = self._storage.read_font(md5, cache)
+        return content
+
+    def _index(self) -> None:
+        # built under the lock and published at once, so that sessions never
+        # build an index lazily from metas that are being replaced
+        indexes = {attr: getattr(type(self), attr).func(self) for attr in self._indexes}
+        self.__dict__.update(indexes)
+
     def _list_font_info(self, md5: Md5) -> Meta:
         meta = self._metas[md5]
         func = lambda x: f'{x["platform"]} ▸ {x["platEnc"]} ▸ {x["lang"]}'.upper()
@@ -253,23 +322,28 @@ class App:
         src = p.Path(file.name)
         content = file.read()
         md5 = util.hash.md5(content)
-        directory = self._cache / md5
-        dst = directory / 'data.bin'
-        if directory.exists():
-            self._metas[md5]['alias'] = sorted({src.stem}.union(self._metas[md5]['alias']))
-        else:
-            directory.mkdir(parents=False, exist_ok=False)
-            dst.write_bytes(content)
+        if md5 not in self._metas:
+            with tempfile.TemporaryDirectory() as directory:
+                dst = p.Path(directory) / 'data.bin'
+                dst.write_bytes(content)
+                try:
+                    meta = self._upload_font_meta(src, dst)
+                except Exception:
+                    return None
+        with self._lock:
+            # merge into the stored meta, other replicas may have added aliases
             try:
-                self._metas[md5] = self._upload_font_meta(src, dst)
-            except Exception:
-                shutil.rmtree(directory)
-                return None
-        # post-process
-        self._dump()
-        for attr in ['char2md5', 'file2md5', 'md52files', 'md52info']:
-            getattr(self, attr)
-            delattr(self, attr)
+                old = self._storage.read_meta(md5)
+            except FileNotFoundError:
+                old = self._metas.get(md5, None)
+                self._storage.write_font(md5, content)
+            if old is not None:
+                meta = {**old, 'alias': sorted({src.stem}.union(old['alias']))}
+            self._storage.write_meta(md5, meta)
+            # post-process, the next refresh picks up the new stamp
+            self._metas = {**self._metas, md5: meta}
+            self._stamps = {key: value for key, value in self._stamps.items() if key != md5}
+            self._index()
         return md5
 
     def _upload_font_meta(self, src: p.Path, dst: p.Path) -> Meta:
@@ -296,7 +370,16 @@ if __name__ == '__main__':
         initial_sidebar_state='auto',
     )
 
-    app = App.load()
+    @st.cache_resource
+    def load(url: t.Optional[str], capacity: t.Optional[int], path: t.Optional[str]) -> App:
+        return App.load(App.storage(url, capacity), path)
+
+    app = load(
+        os.environ.get('FONTHUB_STORAGE') or None,
+        int(os.environ.get('FONTHUB_CACHE_SIZE') or 0) or None,
+        os.environ.get('FONTHUB_SNAPSHOT') or None,
+    )
+    app.refresh()
     with st.sidebar:
         with st.form('sidebar'):
             name = st.selectbox('Choose an App', app.all.keys())
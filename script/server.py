@@ -0,0 +1,73 @@
+import argparse
+import http.server
+import json
+import pathlib as p
+import re
+import typing as t
+
+
+pattern = re.compile(r'^/(?P<md5>[0-9a-f]{32})(?:/(?P<name>meta\.json|data\.bin))?$')
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    '''
+    - Stand-in for the remote store of util.storage.RemoteStorage
+    '''
+
+    root = p.Path('cache')
+
+    def do_GET(self) -> None:
+        if self.path == '/':
+            # same stamp as util.storage.LocalStorage
+            stamps = {}
+            for directory in sorted(self.root.iterdir()):
+                path = directory / 'meta.json'
+                if path.is_file():
+                    stat = path.stat()
+                    stamps[directory.name] = f'{stat.st_mtime_ns:x}-{stat.st_size:x}'
+            self._send(200, json.dumps(stamps).encode())
+        else:
+            path = self._file()
+            if path is not None:
+                self._send(200, path.read_bytes())
+
+    def do_PUT(self) -> None:
+        match = pattern.match(self.path)
+        if match is None or match['name'] is None:
+            return self._send(400)
+        content = self.rfile.read(int(self.headers['Content-Length']))
+        directory = self.root / match['md5']
+        directory.mkdir(parents=False, exist_ok=True)
+        tmp = directory / f'.{match["name"]}.tmp'
+        tmp.write_bytes(content)
+        tmp.replace(directory/match['name'])
+        self._send(201)
+
+    def _file(self) -> t.Optional[p.Path]:
+        match = pattern.match(self.path)
+        if match is None or match['name'] is None:
+            return self._send(400)
+        path = self.root / match['md5'] / match['name']
+        if not path.is_file():
+            return self._send(404)
+        return path
+
+    def _send(self, code: int, content: bytes = b'') -> None:
+        self.send_response(code)
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        if content:
+            self.wfile.write(content)
+
+
+parser = argparse.ArgumentParser(description='Serve a cache directory as a remote store')
+parser.add_argument('root', nargs='?', default='cache', help='cache directory')
+parser.add_argument('--host', default='127.0.0.1')
+parser.add_argument('--port', type=int, default=8000, help='0 picks a free port')
+args = parser.parse_args()
+Handler.root = p.Path(args.root)
+Handler.root.mkdir(parents=True, exist_ok=True)
+server = http.server.ThreadingHTTPServer((args.host, args.port), Handler)
+host, port = server.server_address[:2]
+print(f'Serving {Handler.root} on http://{host}:{port}', flush=True)
+server.serve_forever()
@@ -0,0 +1,17 @@
+import argparse
+import pathlib as p
+import sys
+
+
+root = p.Path(__file__).absolute().parents[1]
+sys.path.insert(0, root.as_posix())
+
+from app import App  # noqa: E402
+
+
+parser = argparse.ArgumentParser(description='Export cache into a packed snapshot')
+parser.add_argument('path', nargs='?', default='cache.snapshot', help='snapshot file')
+parser.add_argument('--blob', action='store_true', help='pack font files as well')
+parser.add_argument('--url', default=None, help='remote store, local cache if omitted')
+args = parser.parse_args()
+App.load(App.storage(args.url)).export(args.path, blob=args.blob)
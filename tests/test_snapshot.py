@@ -0,0 +1,60 @@
+import pathlib as p
+import tempfile
+import unittest
+
+import util
+
+
+class TestSnapshot(unittest.TestCase):
+    '''
+    - Runs util.snapshot.Snapshot against files in a temporary directory
+    '''
+
+    md5s = ['0'*32, '1'*32]
+    blobs = {'0'*32: b'abcd', '1'*32: b'efghij'}
+    catalog = {'version': '2023.03.07', 'char2md5': {65: {'0'*32}}}
+
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = p.Path(self._tmp.name)
+        self.path = self.root / 'cache.snapshot'
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def dump(self, sizes: util.type.DictStr[int]) -> None:
+        util.snapshot.Snapshot.dump(self.path, self.catalog, sizes, self.blobs.__getitem__)
+
+    def test_catalog(self) -> None:
+        util.snapshot.Snapshot.dump(self.path, self.catalog)
+        snapshot = util.snapshot.Snapshot.load(self.path)
+        self.assertEqual(snapshot['char2md5'], {65: {'0'*32}})
+        self.assertIsNone(snapshot.blob(self.md5s[0]))
+
+    def test_blob(self) -> None:
+        self.dump({md5: len(blob) for md5, blob in self.blobs.items()})
+        snapshot = util.snapshot.Snapshot.load(self.path)
+        self.assertEqual(snapshot['version'], '2023.03.07')
+        for md5, blob in self.blobs.items():
+            self.assertEqual(snapshot.blob(md5), blob)
+        self.assertIsNone(snapshot.blob('f'*32))
+
+    def test_truncated(self) -> None:
+        self.dump({md5: len(blob) for md5, blob in self.blobs.items()})
+        content = self.path.read_bytes()
+        for size in [len(content)-3, 20, 10, 0]:
+            self.path.write_bytes(content[:size])
+            with self.assertRaises(ValueError):
+                util.snapshot.Snapshot.load(self.path)
+
+    def test_size_mismatch(self) -> None:
+        util.snapshot.Snapshot.dump(self.path, self.catalog)
+        content = self.path.read_bytes()
+        with self.assertRaises(ValueError):
+            self.dump({self.md5s[0]: 4, self.md5s[1]: 7})
+        self.assertEqual(self.path.read_bytes(), content)
+        self.assertEqual([path.name for path in self.root.iterdir()], [self.path.name])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+import pathlib as p
+import subprocess
+import sys
+import tempfile
+import unittest
+
+import util
+
+
+root = p.Path(__file__).absolute().parents[1]
+
+
+class TestRemoteStorage(unittest.TestCase):
+    '''
+    - Runs util.storage.RemoteStorage against script/server.py
+    '''
+
+    md5s = ['0'*32, '1'*32, '2'*32]
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls._tmp = tempfile.TemporaryDirectory()
+        cls.store = p.Path(cls._tmp.name) / 'store'
+        cls.lru = p.Path(cls._tmp.name) / 'lru'
+        cls.server = subprocess.Popen(
+            [sys.executable, (root/'script'/'server.py').as_posix(), cls.store.as_posix(), '--port', '0'],
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True,
+        )
+        cls.url = cls.server.stdout.readline().split()[-1]
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.server.terminate()
+        cls.server.wait()
+        cls.server.stdout.close()
+        cls._tmp.cleanup()
+
+    def test_meta(self) -> None:
+        storage = util.storage.RemoteStorage(self.url)
+        md5 = self.md5s[0]
+        storage.write_meta(md5, {'alias': ['华文行楷']})
+        self.assertIn(md5, storage.stamps())
+        self.assertEqual(storage.read_meta(md5), {'alias': ['华文行楷']})
+        stamp = storage.stamps()[md5]
+        storage.write_meta(md5, {'alias': ['华文行楷', 'Regular']})
+        self.assertNotEqual(storage.stamps()[md5], stamp)
+
+    def test_font(self) -> None:
+        cache = util.storage.LRUCache(self.lru, capacity=10)
+        storage = util.storage.RemoteStorage(self.url, cache)
+        seed = util.storage.LocalStorage(self.store)
+        a, b, c = self.md5s
+        seed.write_font(a, b'abcd')
+        seed.write_font(b, b'efghij')
+        # miss then hit
+        self.assertIsNone(cache.get(a))
+        self.assertEqual(storage.read_font(a), b'abcd')
+        (self.store/a/'data.bin').unlink()
+        self.assertEqual(storage.read_font(a), b'abcd')
+        # eviction
+        self.assertEqual(storage.read_font(b), b'efghij')
+        storage.write_font(c, b'kl')
+        self.assertIsNone(cache.get(a))
+        self.assertEqual(sorted(path.name for path in self.lru.iterdir()), [b, c])
+
+    def test_missing(self) -> None:
+        storage = util.storage.RemoteStorage(self.url)
+        md5 = 'f'*32
+        with self.assertRaises(FileNotFoundError):
+            storage.read_meta(md5)
+        with self.assertRaises(FileNotFoundError):
+            storage.read_font(md5)
+
+
+if __name__ == '__main__':
+    unittest.main()
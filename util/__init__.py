@@ -1,4 +1,4 @@
-__all__ = ['font', 'hash', 'json', 'type']
+__all__ = ['font', 'hash', 'json', 'snapshot', 'storage', 'type']
 
 
-from . import font, hash, json, type
+from . import font, hash, json, snapshot, storage, type
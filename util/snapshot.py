@@ -0,0 +1,99 @@
+__all__ = ['Snapshot']
+
+
+import mmap
+import os
+import pathlib as p
+import pickle
+import struct
+import tempfile
+import typing as t
+
+from .type import DictStr, Object, Path
+
+if t.TYPE_CHECKING:
+    from typing_extensions import Self
+
+
+class Snapshot:
+    '''
+    - Layout:
+        - magic: 8 bytes
+        - header size: 8 bytes, little endian
+        - header: pickled dict of catalog objects and blob offsets
+        - blobs: raw font files, concatenated
+    - Note:
+        - header is unpickled, only load snapshots from trusted sources
+        - the file stays mapped for the lifetime of the process
+    '''
+
+    magic = b'FONTHUB\x00'
+    layout = struct.Struct('<8sQ')
+
+    def __init__(self, header: DictStr[Object], buffer: mmap.mmap) -> None:
+        self._header = header
+        self._buffer = buffer
+
+    def __getitem__(self, key: str) -> Object:
+        return self._header['catalog'][key]
+
+    @classmethod
+    def dump(
+        cls,
+        path: Path,
+        catalog: DictStr[Object],
+        sizes: t.Optional[DictStr[int]] = None,
+        read: t.Optional[t.Callable[[str], bytes]] = None,
+    ) -> None:
+        sizes = sizes or {}
+        offset, offsets = 0, {}
+        for md5, size in sizes.items():
+            offsets[md5] = offset, size
+            offset += size
+        header = pickle.dumps({'catalog': catalog, 'blobs': offsets}, protocol=pickle.HIGHEST_PROTOCOL)
+        path = p.Path(path)
+        with tempfile.NamedTemporaryFile(dir=path.parent, prefix=f'.{path.name}.', delete=False) as file:
+            try:
+                file.write(cls.layout.pack(cls.magic, len(header)))
+                file.write(header)
+                for md5, size in sizes.items():
+                    content = read(md5)
+                    if len(content) != size:
+                        raise ValueError(f'{md5} has {len(content)} bytes, expected {size}')
+                    file.write(content)
+            except BaseException:
+                file.close()
+                os.unlink(file.name)
+                raise
+        p.Path(file.name).replace(path)
+
+    @classmethod
+    def load(cls, path: Path) -> 'Self':
+        with open(path, 'rb') as file:
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(buffer) < cls.layout.size:
+            buffer.close()
+            raise ValueError(f'{path} is not a snapshot')
+        magic, size = cls.layout.unpack_from(buffer, 0)
+        start = cls.layout.size
+        if magic != cls.magic or len(buffer) < start+size:
+            buffer.close()
+            raise ValueError(f'{path} is not a snapshot')
+        header = pickle.loads(buffer[start:start+size])
+        header['start'] = start + size
+        end = header['start'] + sum(size for _, size in header['blobs'].values())
+        if len(buffer) < end:
+            length = len(buffer)
+            buffer.close()
+            raise ValueError(f'{path} is truncated, {length} bytes, expected {end}')
+        return cls(header, buffer)
+
+    def blob(self, md5: str) -> t.Optional[bytes]:
+        if md5 not in self._header['blobs']:
+            return None
+        offset, size = self._header['blobs'][md5]
+        start = self._header['start'] + offset
+        content = self._buffer[start:start+size]
+        if len(content) != size:
+            raise ValueError(f'{md5} has {len(content)} bytes, expected {size}')
+        return content
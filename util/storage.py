@@ -0,0 +1,181 @@
+__all__ = ['LRUCache', 'LocalStorage', 'RemoteStorage', 'Storage']
+
+
+import abc
+import collections as c
+import os
+import pathlib as p
+import tempfile
+import threading
+import typing as t
+import urllib.error
+import urllib.request
+
+from .json import dumps, loads
+from .type import DictStr, Object, Path
+
+
+class Storage(abc.ABC):
+    '''
+    - Layout:
+        - <md5>/meta.json: font information
+        - <md5>/data.bin: font file
+    - Note:
+        - stamps map md5 to an opaque token that changes whenever meta.json
+          is rewritten, so that readers can reload only the changed metas
+    '''
+
+    @abc.abstractmethod
+    def stamps(self) -> DictStr[str]:
+        ...
+
+    def read_meta(self, md5: str) -> Object:
+        return loads(self._read(md5, 'meta.json'))
+
+    def write_meta(self, md5: str, meta: Object) -> None:
+        self._write(md5, 'meta.json', dumps(meta).encode())
+
+    def read_font(self, md5: str, cache: bool = True) -> bytes:
+        return self._read(md5, 'data.bin')
+
+    def write_font(self, md5: str, content: bytes) -> None:
+        self._write(md5, 'data.bin', content)
+
+    @abc.abstractmethod
+    def _read(self, md5: str, name: str) -> bytes:
+        ...
+
+    @abc.abstractmethod
+    def _write(self, md5: str, name: str, content: bytes) -> None:
+        ...
+
+
+class LocalStorage(Storage):
+    def __init__(self, root: Path) -> None:
+        self._root = p.Path(root)
+        self._root.mkdir(parents=True, exist_ok=True)
+
+    def stamps(self) -> DictStr[str]:
+        ans = {}
+        for directory in self._root.iterdir():
+            try:
+                stat = (directory/'meta.json').stat()
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            ans[directory.name] = f'{stat.st_mtime_ns:x}-{stat.st_size:x}'
+        return ans
+
+    def _read(self, md5: str, name: str) -> bytes:
+        return (self._root/md5/name).read_bytes()
+
+    def _write(self, md5: str, name: str, content: bytes) -> None:
+        directory = self._root / md5
+        directory.mkdir(parents=False, exist_ok=True)
+        tmp = directory / f'.{name}.tmp'
+        tmp.write_bytes(content)
+        tmp.replace(directory/name)
+
+
+class LRUCache:
+    '''
+    - Note:
+        - entries are files named by md5, recency is kept in mtime so that
+          it survives restarts and several processes can share one root
+        - the byte cap is tracked per instance, processes sharing a root
+          may together exceed it until one of them restarts and rescans
+    '''
+
+    def __init__(self, root: Path, capacity: int) -> None:
+        self._root = p.Path(root)
+        self._root.mkdir(parents=True, exist_ok=True)
+        self._capacity = capacity  # Byte
+        self._lock = threading.Lock()
+        self._entries = c.OrderedDict()
+        self._size = 0
+        stats = [
+            (path.stat(), path.name)
+            for path in self._root.iterdir()
+            if path.is_file() and not path.name.startswith('.')
+        ]
+        for stat, md5 in sorted(stats, key=lambda x: x[0].st_mtime):
+            self._entries[md5] = stat.st_size
+            self._size += stat.st_size
+        self._evict()
+
+    def get(self, md5: str) -> t.Optional[bytes]:
+        with self._lock:
+            if md5 not in self._entries:
+                return None
+            path = self._root / md5
+            try:
+                content = path.read_bytes()
+                os.utime(path)
+            except FileNotFoundError:
+                self._size -= self._entries.pop(md5)
+                return None
+            self._entries.move_to_end(md5)
+            return content
+
+    def put(self, md5: str, content: bytes) -> None:
+        if len(content) > self._capacity:
+            return
+        with self._lock:
+            with tempfile.NamedTemporaryFile(dir=self._root, prefix=f'.{md5}.', delete=False) as file:
+                file.write(content)
+            p.Path(file.name).replace(self._root/md5)
+            self._size += len(content) - self._entries.pop(md5, 0)
+            self._entries[md5] = len(content)
+            self._evict()
+
+    def _evict(self) -> None:
+        while self._size > self._capacity:
+            md5, size = self._entries.popitem(last=False)
+            self._size -= size
+            (self._root/md5).unlink(missing_ok=True)
+
+
+class RemoteStorage(Storage):
+    '''
+    - API (see script/server.py for a stand-in server):
+        - GET    /:                   JSON object of md5 to stamp
+        - GET    /<md5>/<name>:       file content
+        - PUT    /<md5>/<name>:       upload file content
+    '''
+
+    def __init__(self, url: str, cache: t.Optional[LRUCache] = None, timeout: float = 30.0) -> None:
+        self._url = url.rstrip('/')
+        self._cache = cache
+        self._timeout = timeout
+
+    def stamps(self) -> DictStr[str]:
+        return loads(self._request('GET', '/'))
+
+    def read_font(self, md5: str, cache: bool = True) -> bytes:
+        if self._cache is None or not cache:
+            return super().read_font(md5)
+        content = self._cache.get(md5)
+        if content is None:
+            content = super().read_font(md5)
+            self._cache.put(md5, content)
+        return content
+
+    def write_font(self, md5: str, content: bytes) -> None:
+        super().write_font(md5, content)
+        if self._cache is not None:
+            self._cache.put(md5, content)
+
+    def _read(self, md5: str, name: str) -> bytes:
+        return self._request('GET', f'/{md5}/{name}')
+
+    def _write(self, md5: str, name: str, content: bytes) -> None:
+        self._request('PUT', f'/{md5}/{name}', content)
+
+    def _request(self, method: str, path: str, data: t.Optional[bytes] = None) -> bytes:
+        request = urllib.request.Request(f'{self._url}{path}', data=data, method=method)
+        try:
+            with urllib.request.urlopen(request, timeout=self._timeout) as response:
+                return response.read()
+        except urllib.error.HTTPError as error:
+            if error.code == 404:
+                raise FileNotFoundError(f'{self._url}{path}') from error
+            raise